@@ -23,6 +23,11 @@ from zwave_client import ZWaveClient
 _LOG = logging.getLogger(__name__)
 
 
+def _zwave_to_brightness(level: float) -> int:
+    """Convert a Z-Wave level (0-100) to a ucapi brightness (0-255)."""
+    return int(level * 255) // 100
+
+
 class SmartHub(ExternalClientDevice):
     """Representing a Z-Wave Controller."""
 
@@ -48,9 +53,14 @@ class SmartHub(ExternalClientDevice):
         )
         self._lights: list[ZWaveLightInfo] = []
         self._covers: list[ZWaveCoverInfo] = []
+        # Node ID indexes over the lists above, rebuilt by get_lights()/get_covers()
+        self._lights_by_id: dict[int, ZWaveLightInfo] = {}
+        self._covers_by_id: dict[int, ZWaveCoverInfo] = {}
         # Attribute storage for entities
         self._light_attributes: dict[str, LightAttributes] = {}
         self._cover_attributes: dict[str, CoverAttributes] = {}
+        # Entity identifiers by (entity type, node ID), see _entity_id()
+        self._entity_ids: dict[tuple[EntityTypes, int], str] = {}
 
     # ─────────────────────────────────────────────────────────────────
     # Properties (required by BaseDeviceInterface)
@@ -102,6 +112,16 @@ class SmartHub(ExternalClientDevice):
         """Return the list of cover entities."""
         return self._covers
 
+    @property
+    def lights_by_id(self) -> dict[int, ZWaveLightInfo]:
+        """Return the light entities keyed by node ID."""
+        return self._lights_by_id
+
+    @property
+    def covers_by_id(self) -> dict[int, ZWaveCoverInfo]:
+        """Return the cover entities keyed by node ID."""
+        return self._covers_by_id
+
     @property
     def light_attributes(self) -> dict[str, LightAttributes]:
         """Return the light attributes dictionary."""
@@ -121,15 +141,21 @@ class SmartHub(ExternalClientDevice):
         :param entity_id: Entity identifier to get attributes for
         :return: Dictionary of entity attributes or dataclass instance
         """
-        # Check if it's a light entity
-        if entity_id in self.light_attributes:
-            return self.light_attributes[entity_id]
-
-        # Check if it's a cover entity
-        if entity_id in self.cover_attributes:
-            return self.cover_attributes[entity_id]
-
-        return {}
+        attributes = self._light_attributes.get(entity_id)
+        if attributes is None:
+            attributes = self._cover_attributes.get(entity_id)
+        return {} if attributes is None else attributes
+
+    def _entity_id(self, entity_type: EntityTypes, node_id: int) -> str:
+        """Return the entity identifier of a light or cover node."""
+        key = (entity_type, node_id)
+        entity_id = self._entity_ids.get(key)
+        if entity_id is None:
+            entity_id = create_entity_id(
+                entity_type, self._device_config.identifier, str(node_id)
+            )
+            self._entity_ids[key] = entity_id
+        return entity_id
 
     # ─────────────────────────────────────────────────────────────────
     # ExternalClientDevice Implementation
@@ -145,17 +171,18 @@ class SmartHub(ExternalClientDevice):
         if not success:
             raise ConnectionError("Failed to connect to Z-Wave controller")
 
-        # Populate lights and covers from Z-Wave network
-        await self.get_lights()
-        await self.get_covers()
+        # Populate lights and covers from Z-Wave network. Both only filter the node
+        # snapshot already held by the client, so build it once and share it
+        devices = self._client.get_devices()
+        await self.get_lights(devices)
+        await self.get_covers(devices)
 
-        # Initialize attributes for each entity
+        # Initialize attributes for each entity, dropping entries of nodes that
+        # are no longer part of the network since the last connection
+        self._light_attributes.clear()
+        self._cover_attributes.clear()
         for light_info in self._lights:
-            entity_id = create_entity_id(
-                EntityTypes.LIGHT,
-                self._device_config.identifier,
-                str(light_info.node_id),
-            )
+            entity_id = self._entity_id(EntityTypes.LIGHT, light_info.node_id)
             brightness = int(light_info.brightness)
             self._light_attributes[entity_id] = LightAttributes(
                 STATE=LightStates.ON if brightness > 0 else LightStates.OFF,
@@ -163,19 +190,12 @@ class SmartHub(ExternalClientDevice):
             )
 
         for cover_info in self._covers:
-            entity_id = create_entity_id(
-                EntityTypes.COVER,
-                self._device_config.identifier,
-                str(cover_info.node_id),
-            )
+            entity_id = self._entity_id(EntityTypes.COVER, cover_info.node_id)
+            position = cover_info.position
             # Convert Z-Wave position (0-99) to UI position (0-100)
-            ui_position = 100 if cover_info.position >= 99 else int(cover_info.position)
-
             self._cover_attributes[entity_id] = CoverAttributes(
-                STATE=CoverStates.OPEN
-                if cover_info.position > 50
-                else CoverStates.CLOSED,
-                POSITION=ui_position,
+                STATE=CoverStates.OPEN if position > 50 else CoverStates.CLOSED,
+                POSITION=100 if position >= 99 else int(position),
             )
 
         # Set up event handlers
@@ -233,16 +253,17 @@ class SmartHub(ExternalClientDevice):
                 )
                 return
 
-            _LOG.debug(
-                "⚡ BRIDGE [%s]: Value updated - node %d, event_info: %s",
-                self.log_id,
-                node_id,
-                event_info,
-            )
+            if _LOG.isEnabledFor(logging.DEBUG):
+                _LOG.debug(
+                    "⚡ BRIDGE [%s]: Value updated - node %d, event_info: %s",
+                    self.log_id,
+                    node_id,
+                    event_info,
+                )
 
             # Check if it's a light or cover and update accordingly
-            is_light = any(light.node_id == node_id for light in self._lights)
-            is_cover = any(cover.node_id == node_id for cover in self._covers)
+            is_light = node_id in self._lights_by_id
+            is_cover = node_id in self._covers_by_id
 
             # For covers, handle targetValue and duration properties specially
             if is_cover:
@@ -309,10 +330,7 @@ class SmartHub(ExternalClientDevice):
     def _update_light(self, node_id: int, event_info: dict | None = None) -> None:
         """Update light state in cache and store in attributes."""
         try:
-            # Find the light using comprehension
-            light = next(
-                (entity for entity in self._lights if entity.node_id == node_id), None
-            )
+            light = self._lights_by_id.get(node_id)
 
             if not light:
                 _LOG.debug("[%s] Light not found for node_id: %s", self.log_id, node_id)
@@ -363,25 +381,21 @@ class SmartHub(ExternalClientDevice):
 
                 # Update light state
                 light.brightness = 0
-                _LOG.debug("Event Info: %s", new_value)
                 if new_value > 0:
-                    light.brightness = new_value * 255 / 100
+                    light.brightness = _zwave_to_brightness(new_value)
                 light.current_state = light.brightness
 
-                _LOG.debug(
-                    "[%s] Updated light cache: node_id=%s, state=%s, brightness=%s",
-                    self.log_id,
-                    node_id,
-                    light.current_state,
-                    light.brightness,
-                )
+                if _LOG.isEnabledFor(logging.DEBUG):
+                    _LOG.debug(
+                        "[%s] Updated light cache: node_id=%s, state=%s, brightness=%s",
+                        self.log_id,
+                        node_id,
+                        light.current_state,
+                        light.brightness,
+                    )
 
             # Store attributes in dataclass
-            entity_id = create_entity_id(
-                EntityTypes.LIGHT,
-                self._device_config.identifier,
-                str(light.node_id),
-            )
+            entity_id = self._entity_id(EntityTypes.LIGHT, light.node_id)
 
             # Get old attributes to compare
             old_attributes = self._light_attributes.get(entity_id)
@@ -404,12 +418,15 @@ class SmartHub(ExternalClientDevice):
         except Exception:  # pylint: disable=broad-exception-caught
             _LOG.exception("[%s] Light update: protocol error", self.log_id)
 
-    async def get_lights(self) -> list[Any]:
+    async def get_lights(
+        self, devices: dict[int, dict[str, Any]] | None = None
+    ) -> list[Any]:
         """Return the list of light entities from Z-Wave network."""
         if not self._client or not self._client.connected:
             return []
 
-        devices = self._client.get_devices()
+        if devices is None:
+            devices = self._client.get_devices()
         light_list = []
 
         for node_id, device_info in devices.items():
@@ -423,7 +440,7 @@ class SmartHub(ExternalClientDevice):
                 # Get current value from Z-Wave (0-100)
                 zwave_value = device_info.get("current_value", 0)
                 # Convert Z-Wave brightness (0-100) to ucapi brightness (0-255)
-                brightness = 0 if zwave_value == 0 else int(zwave_value * 255 / 100)
+                brightness = _zwave_to_brightness(zwave_value)
 
                 light_list.append(
                     ZWaveLightInfo(
@@ -439,6 +456,7 @@ class SmartHub(ExternalClientDevice):
 
         # Update internal lights list
         self._lights = light_list
+        self._lights_by_id = {light.node_id: light for light in light_list}
 
         return light_list
 
@@ -453,15 +471,13 @@ class SmartHub(ExternalClientDevice):
             else:
                 await self._client.set_dimmer_level(node_id, brightness)
 
-            entity_id = create_entity_id(
-                EntityTypes.LIGHT,
-                self._device_config.identifier,
-                str(light_id),
-            )
+            entity_id = self._entity_id(EntityTypes.LIGHT, node_id)
 
             self._light_attributes[entity_id] = LightAttributes(
                 STATE=LightStates.ON if brightness > 0 else LightStates.OFF,
-                BRIGHTNESS=100 if brightness == 99 else int(brightness * 255 / 100),
+                BRIGHTNESS=(
+                    100 if brightness == 99 else _zwave_to_brightness(brightness)
+                ),
             )
 
         except Exception as err:  # pylint: disable=broad-exception-caught
@@ -471,14 +487,7 @@ class SmartHub(ExternalClientDevice):
         """Toggle a light."""
         try:
             # Get current state from lights list
-            light = next(
-                (
-                    light_entity
-                    for light_entity in self._lights
-                    if light_entity.node_id == light_id
-                ),
-                None,
-            )
+            light = self._lights_by_id.get(light_id)
             if light:
                 is_on = light.current_state > 0
                 node_id = light.node_id
@@ -487,11 +496,7 @@ class SmartHub(ExternalClientDevice):
                 else:
                     await self._client.turn_on(node_id)
 
-                entity_id = create_entity_id(
-                    EntityTypes.LIGHT,
-                    self._device_config.identifier,
-                    str(light_id),
-                )
+                entity_id = self._entity_id(EntityTypes.LIGHT, light.node_id)
 
                 self._light_attributes[entity_id] = LightAttributes(
                     STATE=LightStates.OFF if is_on else LightStates.ON,
@@ -507,17 +512,11 @@ class SmartHub(ExternalClientDevice):
     def _set_cover_stationary(self, node_id: int) -> None:
         """Set cover to stationary state (OPEN or CLOSED based on current position)."""
         try:
-            cover = next(
-                (entity for entity in self._covers if entity.node_id == node_id), None
-            )
+            cover = self._covers_by_id.get(node_id)
             if not cover:
                 return
 
-            entity_id = create_entity_id(
-                EntityTypes.COVER,
-                self._device_config.identifier,
-                str(node_id),
-            )
+            entity_id = self._entity_id(EntityTypes.COVER, node_id)
 
             # Get current position
             ui_position = 100 if cover.position >= 99 else int(cover.position)
@@ -543,10 +542,7 @@ class SmartHub(ExternalClientDevice):
     def _update_cover(self, node_id: int, event_info: dict | None = None) -> None:
         """Update cover state in cache and store in attributes."""
         try:
-            # Find the cover using comprehension
-            cover = next(
-                (entity for entity in self._covers if entity.node_id == node_id), None
-            )
+            cover = self._covers_by_id.get(node_id)
 
             if not cover:
                 _LOG.debug("[%s] Cover not found for node_id: %s", self.log_id, node_id)
@@ -606,37 +602,34 @@ class SmartHub(ExternalClientDevice):
                     new_value = max(0, min(100, new_value))
 
                 # Log the position change with additional context
-                old_position = cover.position
-                prev_value = event_info.get("prev_value")
-                _LOG.info(
-                    "📊 [%s] COVER EVENT: node_id=%s | old_cache=%s | new_value=%s | prev_value=%s | DIRECTION: %s",
-                    self.log_id,
-                    node_id,
-                    old_position,
-                    new_value,
-                    prev_value,
-                    "UP"
-                    if new_value > old_position
-                    else ("DOWN" if new_value < old_position else "STABLE"),
-                )
+                if _LOG.isEnabledFor(logging.INFO):
+                    old_position = cover.position
+                    _LOG.info(
+                        "📊 [%s] COVER EVENT: node_id=%s | old_cache=%s | new_value=%s | prev_value=%s | DIRECTION: %s",
+                        self.log_id,
+                        node_id,
+                        old_position,
+                        new_value,
+                        event_info.get("prev_value"),
+                        "UP"
+                        if new_value > old_position
+                        else ("DOWN" if new_value < old_position else "STABLE"),
+                    )
 
                 # Update cover state
                 cover.position = new_value
                 cover.current_state = cover.position
 
-                _LOG.debug(
-                    "[%s] Updated cover cache: node_id=%s, position=%s",
-                    self.log_id,
-                    node_id,
-                    cover.position,
-                )
+                if _LOG.isEnabledFor(logging.DEBUG):
+                    _LOG.debug(
+                        "[%s] Updated cover cache: node_id=%s, position=%s",
+                        self.log_id,
+                        node_id,
+                        cover.position,
+                    )
 
             # Store attributes in dataclass
-            entity_id = create_entity_id(
-                EntityTypes.COVER,
-                self._device_config.identifier,
-                str(cover.node_id),
-            )
+            entity_id = self._entity_id(EntityTypes.COVER, cover.node_id)
 
             # Get old attributes to compare
             old_attributes = self._cover_attributes.get(entity_id)
@@ -686,13 +679,16 @@ class SmartHub(ExternalClientDevice):
         except Exception:  # pylint: disable=broad-exception-caught
             _LOG.exception("[%s] Cover update: protocol error", self.log_id)
 
-    async def get_covers(self) -> list[Any]:
+    async def get_covers(
+        self, devices: dict[int, dict[str, Any]] | None = None
+    ) -> list[Any]:
         """Return the list of cover entities from Z-Wave network."""
         if not self._client or not self._client.connected:
             return []
 
-        _LOG.debug("[%s] ⏱️  Fetching devices from Z-Wave client...", self.log_id)
-        devices = self._client.get_devices()
+        if devices is None:
+            _LOG.debug("[%s] ⏱️  Fetching devices from Z-Wave client...", self.log_id)
+            devices = self._client.get_devices()
         cover_list = []
 
         for node_id, device_info in devices.items():
@@ -720,6 +716,7 @@ class SmartHub(ExternalClientDevice):
 
         # Update internal covers list
         self._covers = cover_list
+        self._covers_by_id = {cover.node_id: cover for cover in cover_list}
 
         return cover_list
 
@@ -729,9 +726,7 @@ class SmartHub(ExternalClientDevice):
             node_id = int(cover_id)
 
             # Get current position to determine direction
-            current_cover = next(
-                (cover for cover in self._covers if cover.node_id == node_id), None
-            )
+            current_cover = self._covers_by_id.get(node_id)
             current_position = current_cover.position if current_cover else 50
 
             # Position: 0 = closed, 100 = open
@@ -751,11 +746,7 @@ class SmartHub(ExternalClientDevice):
                 # No movement
                 state = CoverStates.OPEN
 
-            entity_id = create_entity_id(
-                EntityTypes.COVER,
-                self._device_config.identifier,
-                str(cover_id),
-            )
+            entity_id = self._entity_id(EntityTypes.COVER, node_id)
 
             self._cover_attributes[entity_id] = CoverAttributes(
                 STATE=state,
@@ -773,9 +764,7 @@ class SmartHub(ExternalClientDevice):
             node_id = int(cover_id)
             # For stop, we need to check current position and keep it
             await self.get_covers()
-            cover = next(
-                (entity for entity in self._covers if entity.node_id == node_id), None
-            )
+            cover = self._covers_by_id.get(node_id)
             if cover:
                 # Send the current position to stop movement
                 await self._client.set_dimmer_level(node_id, cover.position)
@@ -2,6 +2,7 @@
 This module implements the Z-Wave constants for the Remote Two/3 integration driver.
 """
 
+import sys
 from dataclasses import dataclass
 
 
@@ -18,6 +19,10 @@ class ZWaveConfig:
     model: str
     """Model name of the controller."""
 
+    def __post_init__(self):
+        """Normalize the identifier, it is used as a key for every entity lookup."""
+        self.identifier = sys.intern(str(self.identifier))
+
 
 @dataclass
 class ZWaveLightInfo:
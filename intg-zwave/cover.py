@@ -16,6 +16,14 @@ from ucapi_framework import create_entity_id, Entity
 _LOG = logging.getLogger(__name__)
 
 
+def _attrs_from_position(position: int) -> dict[cover.Attributes, Any]:
+    """Return the initial cover attributes for a Z-Wave position (0-99)."""
+    return {
+        cover.Attributes.STATE: "OPEN" if position > 50 else "CLOSED",
+        cover.Attributes.POSITION: 100 if position == 99 else position,
+    }
+
+
 class ZWaveCover(Cover, Entity):
     """Representation of a Z-Wave Cover entity."""
 
@@ -26,20 +34,12 @@ class ZWaveCover(Cover, Entity):
         device: SmartHub,
     ):
         """Initialize the class."""
-        _LOG.debug("Z-Wave Cover init")
         self.config = config
         self.cover: ZWaveCoverInfo | None = None
 
         self.device: SmartHub | None = device
         if self.device:
-            self.cover = next(
-                (
-                    entity
-                    for entity in self.device.covers
-                    if entity.node_id == cover_info.node_id
-                ),
-                None,
-            )
+            self.cover = self.device.covers_by_id.get(cover_info.node_id, cover_info)
         else:
             self.cover = cover_info
 
@@ -55,14 +55,7 @@ class ZWaveCover(Cover, Entity):
                 cover.Features.CLOSE,
                 cover.Features.POSITION,
             ],
-            attributes={
-                cover.Attributes.STATE: "OPEN"
-                if self.cover.position > 50
-                else "CLOSED",
-                cover.Attributes.POSITION: 100
-                if self.cover.position == 99
-                else self.cover.position,
-            },
+            attributes=_attrs_from_position(self.cover.position),
             device_class=cover.DeviceClasses.SHADE,
             cmd_handler=self.cover_cmd_handler,
         )
@@ -109,8 +102,9 @@ class ZWaveCover(Cover, Entity):
                         )
 
             # Get updated attributes from device and update entity
-            if entity.id in self.device.cover_attributes:
-                self.update(self.device.get_device_attributes(entity.id), force=True)
+            attributes = self.device.cover_attributes.get(entity.id)
+            if attributes is not None:
+                self.update(attributes, force=True)
 
         except Exception as ex:  # pylint: disable=broad-except
             _LOG.error("Error executing command %s: %s", cmd_id, ex)
@@ -6,19 +6,250 @@ This module implements a Unfolded Circle integration driver for Z-Wave devices.
 :license: Mozilla Public License Version 2.0, see LICENSE for more details.
 """
 
+# Performance note: the hot path of this integration is asyncio dispatch of Z-Wave JS
+# events plus dict and string lookups on ucapi entities, it is I/O bound and does no
+# numeric work. Compiled backends (Numba, Cython, numexpr) would not help here and
+# cannot handle the ucapi objects anyway, optimize at the asyncio/data-structure level.
+
 import asyncio
+import functools
 import logging
 import os
+import sys
 
 from bridge import SmartHub
 from const import ZWaveConfig
 from cover import ZWaveCover
 from light import ZWaveLight
 from setup import ZWaveSetupFlow
+from ucapi import Entity, EntityTypes, cover, light
 from ucapi_framework import BaseConfigManager, BaseIntegrationDriver, get_config_path
 
 _LOG = logging.getLogger("driver")
 
+# Shared STATE=UNAVAILABLE updates per entity type, reused for every entity
+_UNAVAILABLE_BY_TYPE = {
+    EntityTypes.LIGHT: {light.Attributes.STATE: light.States.UNAVAILABLE},
+    EntityTypes.COVER: {cover.Attributes.STATE: cover.States.UNAVAILABLE},
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_entity_id(
+    entity_id: str, separator: str
+) -> tuple[str, str | None, str | None]:
+    """Split an entity ID into (entity_type, device_id, sub_device_id)."""
+    parts = entity_id.split(separator, 2)
+    return (
+        parts[0],
+        parts[1] if len(parts) > 1 else None,
+        parts[2] if len(parts) > 2 else None,
+    )
+
+
+def _same_entity(existing: Entity, entity: Entity) -> bool:
+    """Check if a registered entity already describes a newly created one."""
+    return (
+        getattr(existing, "device", None) is getattr(entity, "device", None)
+        and existing.name == entity.name
+        and existing.features == entity.features
+        and existing.device_class == entity.device_class
+        and existing.options == entity.options
+    )
+
+
+def _log_gather_errors(results: list, message: str) -> None:
+    """Log the exceptions returned by asyncio.gather(return_exceptions=True)."""
+    for result in results:
+        if isinstance(result, Exception):
+            _LOG.error(message, result)
+
+
+class ZWaveIntegrationDriver(BaseIntegrationDriver[SmartHub, ZWaveConfig]):
+    """Z-Wave integration driver."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Create instance."""
+        super().__init__(*args, **kwargs)
+        # Entity IDs registered per device, filled by register_available_entities()
+        self._entity_ids: dict[str, tuple[str, ...]] = {}
+
+    def entity_type_from_entity_id(self, entity_id: str) -> str | None:
+        """Extract entity type from entity identifier."""
+        if not entity_id or self.entity_id_separator not in entity_id:
+            return super().entity_type_from_entity_id(entity_id)
+        return _split_entity_id(entity_id, self.entity_id_separator)[0]
+
+    def device_from_entity_id(self, entity_id: str) -> str | None:
+        """Extract device identifier from entity identifier."""
+        if not entity_id or self.entity_id_separator not in entity_id:
+            return super().device_from_entity_id(entity_id)
+        return _split_entity_id(entity_id, self.entity_id_separator)[1]
+
+    def sub_device_from_entity_id(self, entity_id: str) -> str | None:
+        """Extract sub-device identifier from entity identifier."""
+        if not entity_id or self.entity_id_separator not in entity_id:
+            return super().sub_device_from_entity_id(entity_id)
+        return _split_entity_id(entity_id, self.entity_id_separator)[2]
+
+    def get_entity_ids_for_device(self, device_id: str) -> list[str]:
+        """
+        Get all entity identifiers for a device.
+
+        Uses the IDs recorded when the device's entities were registered, including
+        its configured ones, and only falls back to scanning all entities for
+        devices not registered yet.
+
+        :param device_id: Device identifier
+        :return: List of entity identifiers for this device
+        """
+        entity_ids = self._entity_ids.get(device_id)
+        if entity_ids is None:
+            return super().get_entity_ids_for_device(device_id)
+        return list(entity_ids)
+
+    def register_available_entities(
+        self, device_config: ZWaveConfig, device: SmartHub
+    ) -> None:
+        """
+        Register available entities for a device.
+
+        :param device_config: Device configuration
+        :param device: Device instance
+        """
+        device_id = self.get_device_id(device_config)
+        entities = self.create_entities(device_config, device)
+        _LOG.info("Registering %d available entities for %s", len(entities), device_id)
+
+        available_entities = self.api.available_entities
+        incoming = {entity.id: entity for entity in entities}
+
+        # Drop entities of nodes that were removed from the controller
+        for entity_id in self._entity_ids.get(device_id, ()):
+            if entity_id not in incoming:
+                available_entities.remove(entity_id)
+
+        # Only replace entities that changed, unchanged ones keep their current state
+        for entity_id, entity in incoming.items():
+            existing = available_entities.get(entity_id)
+            if existing is not None:
+                if _same_entity(existing, entity):
+                    continue
+                available_entities.remove(entity_id)
+            available_entities.add(entity)
+
+        # Keep configured entities of removed nodes so they still go unavailable
+        entity_ids = dict.fromkeys(incoming)
+        for entity in self.api.configured_entities.get_all():
+            entity_id = entity["entity_id"]
+            if self.device_from_entity_id(entity_id) == device_id:
+                entity_ids[entity_id] = None
+        self._entity_ids[device_id] = tuple(entity_ids)
+
+    def remove_device(self, device_id: str) -> None:
+        """
+        Remove a configured device.
+
+        :param device_id: Device identifier
+        """
+        # Drop the cached IDs first so stale configured entities are removed too
+        self._entity_ids.pop(device_id, None)
+        device = self._device_instances.get(device_id)
+        if device is not None:
+            # Close the controller connection in the background, the device's
+            # listeners are detached below so its DISCONNECTED event is not handled
+            self._loop.create_task(device.disconnect())
+        super().remove_device(device_id)
+
+    def clear_devices(self) -> None:
+        """Remove all configured devices."""
+        self._entity_ids.clear()
+        for device in self._device_instances.values():
+            self._loop.create_task(device.disconnect())
+        super().clear_devices()
+
+    async def register_all_device_instances(self, connect: bool = False) -> None:
+        """
+        Register all devices from the configuration manager.
+
+        Controllers are always connected before their entities are registered, so
+        they are added concurrently instead of waiting for each connection in turn.
+
+        :param connect: Ignored, hub devices are always connected before registry
+        """
+        if self.config_manager is None:
+            _LOG.warning("Cannot register devices: config_manager is not set")
+            return
+
+        results = await asyncio.gather(
+            *(
+                self.async_add_configured_device(device_config)
+                for device_config in self.config_manager.all()
+            ),
+            return_exceptions=True,
+        )
+        _log_gather_errors(results, "Error registering device: %s")
+
+    async def on_r2_enter_standby(self) -> None:
+        """
+        Handle Remote Two entering standby mode.
+
+        Disconnects all devices concurrently to save resources.
+        """
+        _LOG.debug("Enter standby event: disconnecting device(s)")
+        results = await asyncio.gather(
+            *(device.disconnect() for device in self._device_instances.values()),
+            return_exceptions=True,
+        )
+        _log_gather_errors(results, "Error disconnecting device: %s")
+
+    async def on_device_disconnected(self, device_id: str) -> None:
+        """
+        Handle device disconnection.
+
+        Sets all entity states to UNAVAILABLE when device disconnects.
+
+        :param device_id: Device identifier
+        """
+        _LOG.debug("Device disconnected: %s", device_id)
+        self._set_entities_unavailable(device_id)
+
+    async def on_device_connection_error(self, device_id: str, message: str) -> None:
+        """
+        Handle device connection error.
+
+        Sets all entity states to UNAVAILABLE when device connection fails.
+
+        :param device_id: Device identifier
+        :param message: Error message
+        """
+        _LOG.error("[%s] Connection error: %s", device_id, message)
+        self._set_entities_unavailable(device_id)
+
+    def _set_entities_unavailable(self, device_id: str) -> None:
+        """Mark all configured entities of a device as UNAVAILABLE."""
+        configured_entities = self.api.configured_entities
+        get_configured = configured_entities.get
+        update_attributes = configured_entities.update_attributes
+        unavailable_by_type = _UNAVAILABLE_BY_TYPE
+
+        for entity_id in self.get_entity_ids_for_device(device_id):
+            configured_entity = get_configured(entity_id)
+            if configured_entity is None:
+                continue
+
+            attributes = unavailable_by_type.get(configured_entity.entity_type)
+            if attributes is None:
+                continue
+
+            # The watchdog reports an error on every failed reconnect attempt, skip
+            # entities that are already unavailable instead of re-broadcasting them
+            current = configured_entity.attributes or {}
+            if current.items() >= attributes.items():
+                continue
+
+            update_attributes(entity_id, attributes)
+
 
 async def main():
     """Start the Remote Two/3 integration driver."""
@@ -29,8 +260,9 @@ async def main():
     logging.getLogger("driver").setLevel(level)
     logging.getLogger("discover").setLevel(level)
     logging.getLogger("setup").setLevel(level)
+    logging.getLogger("zwave_client").setLevel(level)
 
-    driver = BaseIntegrationDriver(
+    driver = ZWaveIntegrationDriver(
         device_class=SmartHub,
         entity_classes=[
             lambda cfg, dev: [ZWaveLight(cfg, light, dev) for light in dev.lights],
@@ -54,4 +286,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if sys.platform == "win32":
+        asyncio.run(main())
+    else:
+        import uvloop  # pylint: disable=import-outside-toplevel
+
+        uvloop.run(main())
@@ -16,6 +16,13 @@ from ucapi_framework import create_entity_id, Entity
 
 _LOG = logging.getLogger(__name__)
 
+_FEATURES_DIMMABLE = (
+    light.Features.ON_OFF,
+    light.Features.TOGGLE,
+    light.Features.DIM,
+)
+_FEATURES_BINARY = (light.Features.ON_OFF, light.Features.TOGGLE)
+
 
 class ZWaveLight(Light, Entity):
     """Representation of a Z-Wave Light entity."""
@@ -27,37 +34,20 @@ class ZWaveLight(Light, Entity):
         device: SmartHub,
     ):
         """Initialize the class."""
-        _LOG.debug("Z-Wave Light init")
         self.config = config
-        self.features = [
-            light.Features.ON_OFF,
-            light.Features.TOGGLE,
-            light.Features.DIM,
-        ]
 
         self.light: ZWaveLightInfo | None = None
 
         self.device: SmartHub | None = device
         if self.device:
-            self.light = next(
-                (
-                    entity
-                    for entity in self.device.lights
-                    if entity.node_id == light_info.node_id
-                ),
-                None,
-            )
+            self.light = self.device.lights_by_id.get(light_info.node_id, light_info)
         else:
             self.light = light_info
 
-        # Check if device supports dimming based on type
-        if (
-            "switch" in light_info.type.lower()
-            and "multilevel" not in light_info.type.lower()
-        ):
-            # Binary switch, no dimming
-            if light.Features.DIM in self.features:
-                self.features.remove(light.Features.DIM)
+        # Check if device supports dimming based on type, binary switches can't dim
+        light_type = light_info.type.lower()
+        is_binary = "switch" in light_type and "multilevel" not in light_type
+        self.features = list(_FEATURES_BINARY if is_binary else _FEATURES_DIMMABLE)
 
         super().__init__(
             create_entity_id(
@@ -101,8 +91,9 @@ class ZWaveLight(Light, Entity):
             match cmd_id:
                 case light.Commands.ON:
                     if params and Attributes.BRIGHTNESS in params:
-                        brightness = int(params[Attributes.BRIGHTNESS] / 255 * 100)
-                        if brightness < 0 or brightness > 100:
+                        # Convert ucapi brightness (0-255) to Z-Wave level (0-100)
+                        brightness = int(params[Attributes.BRIGHTNESS]) * 100 // 255
+                        if not 0 <= brightness <= 100:
                             _LOG.error(
                                 "Invalid brightness value %s for command %s",
                                 brightness,
@@ -121,8 +112,9 @@ class ZWaveLight(Light, Entity):
                     await self.device.toggle_light(self.light.node_id)
 
             # Get updated attributes from device and update entity
-            if entity.id in self.device.light_attributes:
-                self.update(self.device.get_device_attributes(entity.id))
+            attributes = self.device.light_attributes.get(entity.id)
+            if attributes is not None:
+                self.update(attributes)
 
         except Exception as ex:  # pylint: disable=broad-except
             _LOG.error("Error executing command %s: %s", cmd_id, ex)
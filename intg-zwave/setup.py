@@ -4,6 +4,7 @@
 
 import asyncio
 import logging
+import operator
 from typing import Any
 
 from const import ZWaveConfig
@@ -13,6 +14,26 @@ from zwave_client import ZWaveClient
 
 _LOG = logging.getLogger(__name__)
 
+# Maps the URL separators to underscores for URL-based controller identifiers
+_URL_TRANSLATION = str.maketrans({":": "_", "/": "_"})
+
+# Accepted schemes of the Z-Wave JS Server URL
+_VALID_WS_PREFIXES = ("ws://", "wss://")
+
+# Controller info keys used for the controller identity, with their defaults
+_CONTROLLER_DEFAULTS = {
+    "home_id": None,
+    "sdk_version": "",
+    "library_version": "",
+    "type_name": "Controller",
+    "manufacturer_id": None,
+    "product_type": None,
+    "product_id": None,
+}
+_CONTROLLER_VALUES = operator.itemgetter(*_CONTROLLER_DEFAULTS)
+
+# Upper bound for connecting to the Z-Wave JS Server while the setup screen waits
+_CONNECT_TIMEOUT = 10.0
 
 _MANUAL_INPUT_SCHEMA = RequestUserInput(
     {"en": "Z-Wave Setup"},
@@ -26,7 +47,8 @@ _MANUAL_INPUT_SCHEMA = RequestUserInput(
                 "label": {
                     "value": {
                         "en": (
-                            "Please supply the WebSocket URL of your Z-Wave JS Server (e.g., ws://192.168.1.100:3000)."
+                            "Please supply the WebSocket URL of your Z-Wave JS Server (e.g., ws://192.168.1.100:3000).\n\n"
+                            "Make sure your Z-Wave JS Server is running and accessible at the provided URL."
                         ),
                     }
                 }
@@ -39,23 +61,64 @@ _MANUAL_INPUT_SCHEMA = RequestUserInput(
                 "en": "WebSocket URL",
             },
         },
-        {
-            "id": "setup_info",
-            "label": {
-                "en": "",
-            },
-            "field": {
-                "label": {
-                    "value": {
-                        "en": "Make sure your Z-Wave JS Server is running and accessible at the provided URL.",
-                    }
-                }
-            },
-        },
     ],
 )
 
 
+def _controller_identity(
+    controller_info: dict[str, Any], ws_url: str
+) -> tuple[str, str, str]:
+    """
+    Derive the identifier, name and model of a Z-Wave controller.
+
+    :param controller_info: controller information from the Z-Wave JS Server
+    :param ws_url: WebSocket URL of the Z-Wave JS Server
+    :return: tuple of (identifier, name, model)
+    """
+    (
+        home_id,
+        sdk_version,
+        library_version,
+        controller_type,
+        manufacturer_id,
+        product_type,
+        product_id,
+    ) = _CONTROLLER_VALUES(_CONTROLLER_DEFAULTS | controller_info)
+
+    # Generate identifier from controller's home_id (unique to each Z-Wave network)
+    if home_id:
+        # Home ID is a unique identifier for the Z-Wave network
+        controller_id = f"zwave_{home_id:08x}"
+        _LOG.debug("Using Home ID as identifier: %s", controller_id)
+    else:
+        # Fallback to URL-based identifier if home_id not available
+        controller_id = (
+            ws_url.removeprefix("wss://")
+            .removeprefix("ws://")
+            .translate(_URL_TRANSLATION)
+        )
+        _LOG.warning(
+            "Home ID not available, using URL-based identifier: %s",
+            controller_id,
+        )
+
+    # Generate a friendly name
+    if sdk_version:
+        controller_name = f"Z-Wave {controller_type} (SDK {sdk_version})"
+    elif library_version:
+        controller_name = f"Z-Wave {controller_type} (v{library_version})"
+    else:
+        controller_name = f"Z-Wave {controller_type}"
+
+    # Generate model information
+    if manufacturer_id and product_type and product_id:
+        model = f"Z-Wave Controller (Mfr: {manufacturer_id:04x}, Type: {product_type:04x}, ID: {product_id:04x})"
+    else:
+        model = "Z-Wave JS Server"
+
+    return controller_id, controller_name, model
+
+
 class ZWaveSetupFlow(BaseSetupFlow[ZWaveConfig]):
     """
     Setup flow for Z-Wave integration.
@@ -87,7 +150,7 @@ class ZWaveSetupFlow(BaseSetupFlow[ZWaveConfig]):
 
         if ws_url != "":
             # Validate WebSocket URL format
-            if not ws_url.startswith("ws://") and not ws_url.startswith("wss://"):
+            if not ws_url.startswith(_VALID_WS_PREFIXES):
                 _LOG.error(
                     "The entered WebSocket URL %s is not valid. Must start with ws:// or wss://",
                     ws_url,
@@ -99,7 +162,15 @@ class ZWaveSetupFlow(BaseSetupFlow[ZWaveConfig]):
             try:
                 zwave_client = ZWaveClient(ws_url)
                 try:
-                    success = await zwave_client.connect()
+                    try:
+                        success = await asyncio.wait_for(
+                            zwave_client.connect(), timeout=_CONNECT_TIMEOUT
+                        )
+                    except asyncio.TimeoutError:
+                        _LOG.error(
+                            "Timed out connecting to Z-Wave JS Server at: %s", ws_url
+                        )
+                        return SetupError(IntegrationSetupError.CONNECTION_REFUSED)
                     if not success:
                         _LOG.error(
                             "Failed to connect to Z-Wave JS Server at: %s", ws_url
@@ -110,54 +181,13 @@ class ZWaveSetupFlow(BaseSetupFlow[ZWaveConfig]):
                     controller_info = zwave_client.get_controller_info()
                     _LOG.info("Z-Wave Controller info: %s", controller_info)
 
-                    # Get devices from Z-Wave network
-                    devices = zwave_client.get_devices()
-                    _LOG.debug("Found %d Z-Wave devices", len(devices))
-
-                    # Generate identifier from controller's home_id (unique to each Z-Wave network)
-                    home_id = controller_info.get("home_id")
-                    if home_id:
-                        # Home ID is a unique identifier for the Z-Wave network
-                        controller_id = f"zwave_{home_id:08x}"
-                        _LOG.debug("Using Home ID as identifier: %s", controller_id)
-                    else:
-                        # Fallback to URL-based identifier if home_id not available
-                        controller_id = (
-                            ws_url.replace("ws://", "")
-                            .replace("wss://", "")
-                            .replace(":", "_")
-                            .replace("/", "_")
-                        )
-                        _LOG.warning(
-                            "Home ID not available, using URL-based identifier: %s",
-                            controller_id,
-                        )
-
-                    # Generate a friendly name
-                    sdk_version = controller_info.get("sdk_version", "")
-                    library_version = controller_info.get("library_version", "")
-                    controller_type = controller_info.get("type_name", "Controller")
-
-                    if sdk_version:
-                        controller_name = (
-                            f"Z-Wave {controller_type} (SDK {sdk_version})"
-                        )
-                    elif library_version:
-                        controller_name = (
-                            f"Z-Wave {controller_type} (v{library_version})"
-                        )
-                    else:
-                        controller_name = f"Z-Wave {controller_type}"
-
-                    # Generate model information
-                    manufacturer_id = controller_info.get("manufacturer_id")
-                    product_type = controller_info.get("product_type")
-                    product_id = controller_info.get("product_id")
+                    _LOG.debug(
+                        "Found %d Z-Wave devices", zwave_client.get_device_count()
+                    )
 
-                    if manufacturer_id and product_type and product_id:
-                        model = f"Z-Wave Controller (Mfr: {manufacturer_id:04x}, Type: {product_type:04x}, ID: {product_id:04x})"
-                    else:
-                        model = "Z-Wave JS Server"
+                    controller_id, controller_name, model = _controller_identity(
+                        controller_info, ws_url
+                    )
 
                     return ZWaveConfig(
                         identifier=controller_id,
@@ -167,11 +197,9 @@ class ZWaveSetupFlow(BaseSetupFlow[ZWaveConfig]):
                     )
 
                 finally:
+                    # Returns once the WebSocket close handshake and the listen loop
+                    # have completed, so the driver can reconnect right away
                     await zwave_client.disconnect()
-                    # Give the Z-Wave JS Server a moment to clean up the WebSocket connection
-                    # before the driver attempts to reconnect. This prevents race conditions
-                    # where the server hasn't fully released resources yet.
-                    await asyncio.sleep(0.3)
 
             except Exception as ex:  # pylint: disable=broad-exception-caught
                 _LOG.error(
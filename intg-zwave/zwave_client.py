@@ -9,26 +9,82 @@ A streamlined client for interacting with Z-Wave JS Server that provides:
 """
 
 import asyncio
-from typing import Any, Callable, Dict, List, Optional
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import aiohttp
 from zwave_js_server.client import Client
 
+_LOG = logging.getLogger(__name__)
+
+# Controller attributes reported by get_controller_info(), None when not available
+_CONTROLLER_ATTRIBUTES = (
+    "home_id",
+    "own_node_id",
+    "is_secondary",
+    "is_using_home_id_from_other_network",
+    "is_SIS_present",
+    "was_real_primary",
+    "is_static_update_controller",
+    "is_slave",
+    "serial_api_version",
+    "manufacturer_id",
+    "product_type",
+    "product_id",
+    "supported_function_types",
+    "suc_node_id",
+    "supports_timers",
+    "sdk_version",
+    "library_version",
+    "type",
+    "zwaveApiVersion",
+)
+
 
 class ZWaveClient:
     """A clean, reusable Z-Wave JS Server client."""
 
-    def __init__(self, server_url: str):
+    # Node status -> (name, is_alive, is_asleep)
+    _STATUS_META = {
+        0: ("Unknown", False, False),
+        1: ("Asleep", False, True),
+        2: ("Awake", False, False),
+        3: ("Dead", False, False),
+        4: ("Alive", True, False),
+    }
+
+    def __init__(
+        self, server_url: str, session: Optional[aiohttp.ClientSession] = None
+    ):
         """Initialize the Z-Wave client.
 
         Args:
             server_url: WebSocket URL for the Z-Wave JS Server (e.g., "ws://localhost:3000")
+            session: Optional shared aiohttp session, the caller remains responsible
+                for closing it. A private session is created per connection otherwise.
         """
         self.server_url = server_url
         self.client: Optional[Client] = None
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self._listen_task: Optional[asyncio.Task] = None
+        self._orig_receive_event: Optional[Callable] = None
         self.connected = False
-        self.event_handlers: Dict[str, List[Callable]] = {}
+        # Handlers are stored as tuples that are replaced, never mutated, so events can
+        # be dispatched while handlers are added or removed
+        self.event_handlers: Dict[str, Tuple[Callable, ...]] = {}
+        # Value IDs per property name for each node, see _values_by_property()
+        self._property_index: Dict[int, Dict[str, List[str]]] = {}
+        # Friendly name per node, see _get_node_name()
+        self._name_cache: Dict[int, str] = {}
+        # Handler per Z-Wave JS event type, looked up once per incoming event
+        self._type_dispatch: Dict[str, Callable] = {
+            "value updated": self._handle_value_updated,
+            "node alive": self._handle_node_status_changed,
+            "node dead": self._handle_node_status_changed,
+            "node asleep": self._handle_node_status_changed,
+            "node awake": self._handle_node_status_changed,
+        }
 
     async def connect(self) -> bool:
         """Connect to the Z-Wave JS Server.
@@ -37,7 +93,10 @@ class ZWaveClient:
             True if connection successful, False otherwise
         """
         try:
-            self.session = aiohttp.ClientSession()
+            self._property_index.clear()
+            self._name_cache.clear()
+            if self._owns_session:
+                self.session = aiohttp.ClientSession()
             self.client = Client(self.server_url, self.session)
 
             await self.client.connect()
@@ -45,8 +104,9 @@ class ZWaveClient:
 
             # Wait for driver to be ready
             driver_ready = asyncio.Event()
-            # Start the listen task to process incoming events
-            asyncio.create_task(self.client.listen(driver_ready))
+            # Start the listen task to process incoming events, kept so that it can be
+            # cancelled on disconnect instead of being left running detached
+            self._listen_task = asyncio.create_task(self.client.listen(driver_ready))
 
             await asyncio.wait_for(driver_ready.wait(), timeout=5.0)
 
@@ -58,18 +118,39 @@ class ZWaveClient:
             return True
 
         except (ConnectionError, asyncio.TimeoutError, OSError) as e:
-            print(f"Connection failed: {e}")
+            _LOG.error("Connection failed: %s", e)
             await self.disconnect()
             return False
 
     async def disconnect(self):
         """Disconnect from the Z-Wave JS Server."""
+        if self._orig_receive_event and self.client and self.client.driver:
+            self.client.driver.receive_event = self._orig_receive_event
+        self._orig_receive_event = None
         if self.client and self.client.connected:
             await self.client.disconnect()
-        if self.session:
-            await self.session.close()
+        if self._listen_task:
+            # Normally finished by the client disconnect, this covers failed connects
+            self._listen_task.cancel()
+            await asyncio.gather(self._listen_task, return_exceptions=True)
+            self._listen_task = None
+        if self.session and self._owns_session:
+            # Close the session even if the disconnecting task is being cancelled
+            await asyncio.shield(self.session.close())
         self.connected = False
 
+    async def __aenter__(self) -> "ZWaveClient":
+        """Connect to the Z-Wave JS Server when entering an async context."""
+        if not await self.connect():
+            raise ConnectionError(
+                f"Failed to connect to Z-Wave JS Server at {self.server_url}"
+            )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Disconnect from the Z-Wave JS Server when leaving an async context."""
+        await self.disconnect()
+
     def get_controller_info(self) -> Dict[str, Any]:
         """Get information about the Z-Wave controller.
 
@@ -80,36 +161,7 @@ class ZWaveClient:
             return {}
 
         controller = self.client.driver.controller
-        driver = self.client.driver
-
-        info = {
-            "home_id": getattr(controller, "home_id", None),
-            "own_node_id": getattr(controller, "own_node_id", None),
-            "is_secondary": getattr(controller, "is_secondary", None),
-            "is_using_home_id_from_other_network": getattr(
-                controller, "is_using_home_id_from_other_network", None
-            ),
-            "is_SIS_present": getattr(controller, "is_SIS_present", None),
-            "was_real_primary": getattr(controller, "was_real_primary", None),
-            "is_static_update_controller": getattr(
-                controller, "is_static_update_controller", None
-            ),
-            "is_slave": getattr(controller, "is_slave", None),
-            "serial_api_version": getattr(controller, "serial_api_version", None),
-            "manufacturer_id": getattr(controller, "manufacturer_id", None),
-            "product_type": getattr(controller, "product_type", None),
-            "product_id": getattr(controller, "product_id", None),
-            "supported_function_types": getattr(
-                controller, "supported_function_types", None
-            ),
-            "suc_node_id": getattr(controller, "suc_node_id", None),
-            "supports_timers": getattr(controller, "supports_timers", None),
-            "sdk_version": getattr(driver, "controller", {})
-            and getattr(controller, "sdk_version", None),
-            "library_version": getattr(controller, "library_version", None),
-            "type": getattr(controller, "type", None),
-            "zwaveApiVersion": getattr(controller, "zwaveApiVersion", None),
-        }
+        info = {key: getattr(controller, key, None) for key in _CONTROLLER_ATTRIBUTES}
 
         # Get a friendly name for the controller type
         if info["type"]:
@@ -125,36 +177,26 @@ class ZWaveClient:
         Returns:
             Dictionary mapping node IDs to device information
         """
-        if not self.client or not self.client.driver:
+        driver = self.client.driver if self.client else None
+        if not driver:
             return {}
 
-        devices = {}
-        nodes = self.client.driver.controller.nodes
-
-        for node_id, node in nodes.items():
-            current_value = 0
-            for value_id in node.values.values():
-                if (
-                    hasattr(value_id, "property_name")
-                    and value_id.property_name == "currentValue"
-                ):
-                    current_value = value_id.value
-                    break
-
-            devices[node_id] = {
-                "id": node_id,
-                "name": node.name or f"Node {node_id}",
-                "status": self._get_status_name(node.status),
-                "manufacturer_id": getattr(node, "manufacturer_id", None),
-                "product_type": getattr(node, "product_type", None),
-                "firmware_version": getattr(node, "firmware_version", None),
-                "device_type": self._get_device_type(node),
-                "is_alive": node.status == 4,
-                "is_asleep": node.status == 1,
-                "current_value": current_value,
-            }
+        node_info = self._node_info
+        return {
+            node_id: node_info(node_id, node)
+            for node_id, node in driver.controller.nodes.items()
+        }
+
+    def get_device_count(self) -> int:
+        """Get the number of Z-Wave devices.
 
-        return devices
+        Returns:
+            Number of nodes in the Z-Wave network
+        """
+        if not self.client or not self.client.driver:
+            return 0
+
+        return len(self.client.driver.controller.nodes)
 
     async def get_device_properties(self, node_id: int) -> Dict[str, Any]:
         """Get detailed properties for a specific device.
@@ -165,27 +207,24 @@ class ZWaveClient:
         Returns:
             Dictionary of device properties and values
         """
-        if not self.client or not self.client.driver:
-            return {}
-
-        node = self.client.driver.controller.nodes.get(node_id)
+        node = self._get_node(node_id)
         if not node:
             return {}
 
         properties = {}
         try:
-            value_ids = await node.async_get_defined_value_ids()
-            for value_id in value_ids:
-                val = node.values.get(value_id)
-                if val and hasattr(val, "prope rty_name"):
-                    prop_key = f"{val.command_class_name}.{val.property_name}"
-                    properties[prop_key] = {
-                        "value": val.value,
-                        "writeable": val.metadata.writeable if val.metadata else False,
-                        "type": val.metadata.type if val.metadata else "unknown",
-                    }
-        except (KeyError, AttributeError, ConnectionError) as e:
-            print(f"Error getting properties for node {node_id}: {e}")
+            # The node's values are kept up to date from the event stream, no need to
+            # ask the server for the defined value IDs
+            for val in node.values.values():
+                metadata = val.metadata
+                prop_key = f"{val.command_class_name}.{val.property_name}"
+                properties[prop_key] = {
+                    "value": val.value,
+                    "writeable": metadata.writeable if metadata else False,
+                    "type": metadata.type if metadata else "unknown",
+                }
+        except (KeyError, AttributeError) as e:
+            _LOG.error("Error getting properties for node %s: %s", node_id, e)
 
         return properties
 
@@ -202,25 +241,18 @@ class ZWaveClient:
         Returns:
             True if successful, False otherwise
         """
-        if not self.client or not self.client.driver:
-            return False
-
-        node = self.client.driver.controller.nodes.get(node_id)
+        node = self._get_node(node_id)
         if not node:
             return False
 
         try:
-            for value_id in node.values.values():
-                if (
-                    hasattr(value_id, "property_name")
-                    and value_id.property_name == property_name
-                    and value_id.metadata.writeable
-                ):
-                    await node.async_set_value(value_id, value)
-                    return True
-            return False
+            value_id = self._find_value(node, property_name, writeable=True)
+            if value_id is None:
+                return False
+            await node.async_set_value(value_id, value)
+            return True
         except (KeyError, AttributeError, ConnectionError, ValueError) as e:
-            print(f"Error setting value: {e}")
+            _LOG.error("Error setting value: %s", e)
             return False
 
     async def turn_on(self, node_id: int) -> bool:
@@ -263,13 +295,15 @@ class ZWaveClient:
     def add_event_handler(self, event_type: str, handler: Callable):
         """Add an event handler for Z-Wave events.
 
+        Adding a handler that is already registered for the event type is a no-op.
+
         Args:
             event_type: Type of event ("value_updated", "node_status_changed", "all")
             handler: Function to call when event occurs
         """
-        if event_type not in self.event_handlers:
-            self.event_handlers[event_type] = []
-        self.event_handlers[event_type].append(handler)
+        handlers = self.event_handlers.get(event_type, ())
+        if handler not in handlers:
+            self.event_handlers[event_type] = handlers + (handler,)
 
     def remove_event_handler(self, event_type: str, handler: Callable):
         """Remove an event handler.
@@ -278,11 +312,14 @@ class ZWaveClient:
             event_type: Type of event
             handler: Handler function to remove
         """
-        if event_type in self.event_handlers:
-            try:
-                self.event_handlers[event_type].remove(handler)
-            except ValueError:
-                pass
+        handlers = self.event_handlers.get(event_type, ())
+        if handler in handlers:
+            handlers = tuple(h for h in handlers if h != handler)
+            if handlers:
+                self.event_handlers[event_type] = handlers
+            else:
+                # Drop empty entries, dispatch checks for registered handlers
+                del self.event_handlers[event_type]
 
     def _setup_event_monitoring(self):
         """Set up event monitoring using the fallback approach."""
@@ -290,36 +327,65 @@ class ZWaveClient:
             return
 
         # Override the driver's receive_event method to catch all events
-        original_receive_event = self.client.driver.receive_event
-
-        def enhanced_receive_event(event):
-            self._handle_event(event)
-            return original_receive_event(event)
+        driver = self.client.driver
+        self._orig_receive_event = driver.receive_event
+        driver.receive_event = self._wrapped_receive_event
 
-        self.client.driver.receive_event = enhanced_receive_event
+    def _wrapped_receive_event(self, event):
+        """Handle an event before passing it on to the driver."""
+        self._handle_event(event)
+        try:
+            return self._orig_receive_event(event)
+        finally:
+            # Only after the driver applied the event to its node model, so an
+            # index rebuilt by an event handler above is dropped as well
+            self._invalidate_node_caches(event)
+
+    def _invalidate_node_caches(self, event):
+        """Drop cached node data that the event may have made stale."""
+        event_type = event.type
+        event_data = event.data
+
+        # Value IDs of the node change, rebuild its property index on next use
+        if event_type in ("value added", "value removed", "ready"):
+            self._property_index.pop(event_data.get("nodeId"), None)
+            # A ready event carries a full node dump, which may include a new name
+            if event_type == "ready":
+                self._name_cache.pop(event_data.get("nodeId"), None)
+        elif event_type in ("value updated", "metadata updated"):
+            # Both may create values, drop indexes that lack the property
+            node_id = event_data.get("nodeId")
+            index = self._property_index.get(node_id)
+            if index is not None:
+                property_name = event_data.get("args", {}).get("propertyName")
+                if property_name not in index:
+                    del self._property_index[node_id]
 
     def _handle_event(self, event):
         """Handle incoming Z-Wave events."""
-        event_type = getattr(event, "type", "")
-        event_data = getattr(event, "data", {})
+        event_type = event.type
+        event_data = event.data
 
-        # Handle value updated events
-        if event_type == "value updated":
-            self._handle_value_updated(event, event_data)
+        if not self.event_handlers:
+            return
 
-        # Handle node status events
-        elif event_type in ["node alive", "node dead", "node asleep", "node awake"]:
-            self._handle_node_status_changed(event, event_data)
+        # Handle value updated and node status events
+        handle = self._type_dispatch.get(event_type)
+        if handle is not None:
+            handle(event, event_data)
 
         # Call "all" event handlers
-        for handler in self.event_handlers.get("all", []):
+        for handler in self.event_handlers.get("all", ()):
             try:
                 handler(event_type, event_data)
             except (TypeError, AttributeError) as e:
-                print(f"Error in event handler: {e}")
+                _LOG.exception("Error in event handler: %s", e)
 
     def _handle_value_updated(self, _event, event_data):
         """Handle value updated events."""
+        if "value_updated" not in self.event_handlers:
+            return
+
         args = event_data.get("args", {})
         node_id = event_data.get("nodeId")
 
@@ -343,42 +409,135 @@ class ZWaveClient:
             }
 
             # Call value_updated handlers
-            for handler in self.event_handlers.get("value_updated", []):
+            for handler in self.event_handlers.get("value_updated", ()):
                 try:
                     handler(event_info)
                 except (TypeError, AttributeError) as e:
-                    print(f"Error in value_updated handler: {e}")
+                    _LOG.exception("Error in value_updated handler: %s", e)
 
     def _handle_node_status_changed(self, event, event_data):
         """Handle node status change events."""
-        node_id = event_data.get("nodeId") or getattr(event, "nodeId", None)
+        if "node_status_changed" not in self.event_handlers:
+            return
+
+        node_id = event_data.get("nodeId")
 
         if node_id:
             event_info = {
                 "node_id": node_id,
                 "node_name": self._get_node_name(node_id),
-                "status": getattr(event, "type", "").replace("node ", ""),
+                "status": event.type.replace("node ", ""),
             }
 
             # Call node_status_changed handlers
-            for handler in self.event_handlers.get("node_status_changed", []):
+            for handler in self.event_handlers.get("node_status_changed", ()):
                 try:
                     handler(event_info)
                 except (TypeError, AttributeError) as e:
-                    print(f"Error in node_status_changed handler: {e}")
+                    _LOG.exception("Error in node_status_changed handler: %s", e)
+
+    def _node_info(self, node_id: int, node) -> Dict[str, Any]:
+        """Get the device information of a node.
+
+        Args:
+            node_id: The Z-Wave node ID
+            node: The Z-Wave node
+
+        Returns:
+            Dictionary of device information
+        """
+        value = self._find_value(node, "currentValue")
+        status = node.status
+        meta = self._STATUS_META.get(status)
+        status_name, is_alive, is_asleep = meta or (f"Status {status}", False, False)
+
+        return {
+            "id": node_id,
+            "name": node.name or f"Node {node_id}",
+            "status": status_name,
+            "manufacturer_id": getattr(node, "manufacturer_id", None),
+            "product_type": getattr(node, "product_type", None),
+            "firmware_version": getattr(node, "firmware_version", None),
+            "device_type": self._get_device_type(node),
+            "is_alive": is_alive,
+            "is_asleep": is_asleep,
+            "current_value": value.value if value else 0,
+        }
+
+    def _get_node(self, node_id: int):
+        """Get a node of the connected Z-Wave network.
+
+        Args:
+            node_id: The Z-Wave node ID
+
+        Returns:
+            The node, or None if not connected or the node is unknown
+        """
+        driver = self.client.driver if self.client else None
+        if not driver:
+            return None
+
+        return driver.controller.nodes.get(node_id)
+
+    def _values_by_property(self, node) -> Dict[str, List[str]]:
+        """Get the value IDs of a node grouped by property name.
+
+        The index is built on first use and kept until the node's values change.
+
+        Args:
+            node: The Z-Wave node
+
+        Returns:
+            Dictionary mapping property names to value IDs
+        """
+        index = self._property_index.get(node.node_id)
+        if index is None:
+            index = {}
+            for value_id, value in node.values.items():
+                index.setdefault(value.property_name, []).append(value_id)
+            self._property_index[node.node_id] = index
+        return index
+
+    def _find_value(self, node, property_name: str, writeable: bool = False):
+        """Find the first value of a node with the given property name.
+
+        Args:
+            node: The Z-Wave node
+            property_name: Property name (e.g., "targetValue", "currentValue")
+            writeable: Only return values that can be written
+
+        Returns:
+            The matching value, or None if the node has no such value
+        """
+        index = self._values_by_property(node)
+        for value_id in index.get(property_name, ()):
+            value = node.values.get(value_id)
+            if value is not None and (not writeable or value.metadata.writeable):
+                return value
+        return None
 
     def _get_node_name(self, node_id: int) -> str:
-        """Get friendly name for a node."""
-        if not self.client or not self.client.driver:
+        """Get friendly name for a node.
+
+        Names are cached per node until the next connect or a ready event, which
+        carries the node's full state including its name.
+        """
+        name = self._name_cache.get(node_id)
+        if name is not None:
+            return name
+
+        node = self._get_node(node_id)
+        if not node:
             return f"Node {node_id}"
 
-        node = self.client.driver.controller.nodes.get(node_id)
-        return node.name if node and node.name else f"Node {node_id}"
+        name = node.name or f"Node {node_id}"
+        self._name_cache[node_id] = name
+        return name
 
     def _get_status_name(self, status: int) -> str:
         """Convert status number to readable name."""
-        status_names = {0: "Unknown", 1: "Asleep", 2: "Awake", 3: "Dead", 4: "Alive"}
-        return status_names.get(status, f"Status {status}")
+        meta = self._STATUS_META.get(status)
+        return meta[0] if meta else f"Status {status}"
 
     def _get_device_type(self, node) -> str:
         """Get device type description."""